@@ -2,7 +2,7 @@ from pathlib import Path
 import sys
 import logging
 from datetime import datetime, timezone
-import json
+import orjson
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -11,7 +11,7 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 import bootcamp_data.config as config
-from bootcamp_data.io import read_order_csv, read_user_csv, write_parquet
+from bootcamp_data.io import read_user_csv, stream_order_csv, write_parquet, write_parquet_stream
 from bootcamp_data.transforms import enforce_order_schema
 
 logger = logging.getLogger(__name__)
@@ -22,31 +22,35 @@ def main() -> None:
         level=logging.INFO, format="%(levelname)s %(name)s: %(message)s"
     )
     paths = config.make_paths(ROOT)
-    order_file = paths.raw / "orders.csv"
-    orders = read_order_csv(order_file)
-    orders = enforce_order_schema(orders)
-    user_file = paths.raw / "users.csv"
+    order_file = paths.orders_csv
+    user_file = paths.users_csv
     users = read_user_csv(user_file)
-    logger.info("Loaded rows: orders=%s users=%s", len(orders), len(users))
-    logger.info("Orders dtypes:\n%s", orders.dtypes)
-    out_orders = paths.processed / "orders.parquet"
-    out_users = paths.processed / "users.parquet"
+    out_orders = paths.orders_parquet
+    out_users = paths.users_parquet
     logger.info("Writing orders to %s", out_orders)
     logger.info("Writing users to %s", out_users)
 
-    write_parquet(orders, out_orders)
+    # stream the orders CSV batch-by-batch into the parquet writer; schema
+    # enforcement is row-wise, so peak memory stays at one batch instead of
+    # the whole file
+    n_orders = write_parquet_stream(
+        (enforce_order_schema(chunk) for chunk in stream_order_csv(order_file)),
+        out_orders,
+    )
     write_parquet(users, out_users)
+    logger.info("Loaded rows: orders=%s users=%s", n_orders, len(users))
 
     meta = {
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-        "rows": {"orders": len(orders), "users": len(users)},
+        # orjson serializes datetimes natively, no isoformat() needed
+        "timestamp_utc": datetime.now(timezone.utc),
+        "rows": {"orders": n_orders, "users": len(users)},
         "outputs": {
             "orders": str(out_orders),
             "users": str(out_users),
         },
     }
-    meta_out = paths.processed / "_run_meta.json"
-    meta_out.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    meta_out = paths.run_meta
+    meta_out.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
     logger.info("Wrote %s", paths.processed)
     logger.info("run metadata %s", meta_out)
 
@@ -11,7 +11,7 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 import bootcamp_data.config as config
-from bootcamp_data.io import read_order_csv, read_user_csv, write_parquet
+from bootcamp_data.io import read_order_csv, read_user_csv, read_parquet, write_parquet
 from bootcamp_data.transforms import (
     add_missing_flags,
     normalize_text,
@@ -36,11 +36,17 @@ def main() -> None:
         level=logging.INFO, format="%(levelname)s %(name)s: %(message)s"
     )
     paths = config.make_paths(ROOT)
-    order_file = paths.raw / "orders.csv"
-    user_file = paths.raw / "users.csv"
+    # prefer day1's parquet outputs; the parquet read is roughly 10x faster
+    # than re-parsing the raw CSVs, which day1 has already done
     logger.info("Loading raw inputs ")
-    order_raw = read_order_csv(order_file)
-    user_raw = read_user_csv(user_file)
+    if paths.orders_parquet.exists():
+        order_raw = read_parquet(paths.orders_parquet)
+    else:
+        order_raw = read_order_csv(paths.orders_csv)
+    if paths.users_parquet.exists():
+        user_raw = read_parquet(paths.users_parquet)
+    else:
+        user_raw = read_user_csv(paths.users_csv)
     logger.info("Loaded rows: orders=%s users=%s", len(order_raw), len(user_raw))
     require_columns(
         order_raw,
@@ -84,16 +90,18 @@ def main() -> None:
 
     status_norm = normalize_text(orders["status"])
     mapping = {"paid": "paid", "refund": "refund", "refunded": "refund"}
-    status_clean = apply_mapping(status_norm, mapping)
+    # low-cardinality field: categorical codes make later groupbys and
+    # comparisons integer-based and shrink the column to ~1 byte per row
+    status_clean = apply_mapping(status_norm, mapping).astype("category")
     orders_clean = orders.assign(status_clean=status_clean).pipe(
         add_missing_flags, cols=["amount", "quantity"]
     )
     assert_in_range(orders_clean["amount"], lo=0, name="amount")
     assert_in_range(orders_clean["quantity"], lo=0, name="quantity")
 
-    write_parquet(orders_clean, paths.processed / "orders_clean.parquet")
+    write_parquet(orders_clean, paths.orders_clean_parquet)
 
-    write_parquet(users, paths.processed / "users.parquet")
+    write_parquet(users, paths.users_parquet)
 
     logger.info("Wrote cleaned orders and users to %s", paths.processed)
 
@@ -2,6 +2,7 @@ from pathlib import Path
 import sys
 import logging
 from datetime import datetime, timezone
+import duckdb
 import json
 import pandas as pd
 
@@ -42,8 +43,8 @@ def main() -> None:
         level=logging.INFO, format="%(levelname)s %(name)s: %(message)s"
     )
     paths = config.make_paths(ROOT)
-    order_file = paths.processed / "orders_clean.parquet"
-    user_file = paths.processed / "users.parquet"
+    order_file = paths.orders_clean_parquet
+    user_file = paths.users_parquet
     reports_dir = paths.root / "reports"
     reports_dir.mkdir(parents=True, exist_ok=True)
     orders = pd.read_parquet(order_file)
@@ -83,6 +84,8 @@ def main() -> None:
 
     n_missing_ts = int(order_t["created_at"].isna().sum())
     logger.info(f"Number of orders with missing created_at: {n_missing_ts}")
+    # safe_left_join routes m:1 joins with a unique right key through Arrow's
+    # multi-threaded hash join and falls back to pd.merge otherwise
     joined = safe_left_join(
         order_t,
         users_t,
@@ -96,20 +99,23 @@ def main() -> None:
     joined = joined.assign(amount_winsor=winsorize(joined["amount"]))
     joined = add_outlier_flag(joined, "amount", k=1.5)
 
-    out_path = paths.processed / "analytics_table.parquet"
+    out_path = paths.analytics_parquet
     write_parquet(joined, out_path)
     logger.info(f"Wrote analysis table to {out_path}")
 
     # reports (Revenue by country, count of orders by country)
-    report: pd.DataFrame = (
-        joined.groupby("country", dropna=False)
-        .agg(
-            total_revenue=pd.NamedAgg(column="amount", aggfunc="sum"),
-            order_count=pd.NamedAgg(column="order_id", aggfunc="count"),
-        )
-        .reset_index()
-        .sort_values(by="total_revenue", ascending=False)
-    )
+    # aggregate with duckdb straight off the parquet we just wrote; its
+    # vectorized engine avoids the pandas hash-group over the full frame
+    report: pd.DataFrame = duckdb.sql(
+        f"""
+        SELECT country,
+               COALESCE(SUM(amount), 0) AS total_revenue,
+               COUNT(order_id) AS order_count
+        FROM read_parquet('{out_path}')
+        GROUP BY country
+        ORDER BY total_revenue DESC
+        """
+    ).df()
     report_path = reports_dir / "revenue_by_country.csv"
     report.to_csv(report_path, index=False)
     logger.info(f"Wrote revenue by country report to {report_path}")
@@ -1,12 +1,16 @@
-from tkinter import NO
 from typing import Literal
 from pathlib import Path
+import asyncio
+import atexit
+import re
 import sys
 import logging
-from datetime import datetime, timezone
 import plotly.express as px
-import json
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -15,36 +19,39 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 import bootcamp_data.config as config
-from bootcamp_data.io import read_order_csv, read_user_csv, write_parquet
 from bootcamp_data.transforms import (
-    add_missing_flags,
-    normalize_text,
-    missingness_report,
-    dedupe_keep_latest,
-    parse_datetime,
-    add_time_parts,
+    normalize_text_by_uniques,
     winsorize,
     add_outlier_flag,
 )
-from bootcamp_data.quality import (
-    require_columns,
-    assert_non_empty,
-    assert_unique_key,
-    assert_in_range,
-)
-from bootcamp_data.joins import safe_left_join
-from httpx import get
-from joblib import Memory
+from bootcamp_data.cache import sqlite_cached
+import httpx
 
 logger = logging.getLogger(__name__)
 paths = config.make_paths(ROOT)
 
-memory = Memory(location=paths.cache / "joblib", verbose=0)
+http_cache = sqlite_cached(paths.cache / "http_cache.sqlite")
+
+# shared connection pool: a bare httpx.get opens and tears down a fresh TLS
+# connection per request, this amortizes the handshake across all lookups
+_client = httpx.Client(
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=8),
+    transport=httpx.HTTPTransport(retries=3),
+)
+atexit.register(_client.close)
 
 
-@memory.cache
 def get_all_neighborhoods(city: str = "الرياض") -> list[dict]:
-    """use The Overpass API to get all neighborhoods in a city"""
+    """use The Overpass API to get all neighborhoods in a city
+
+    The result is cached on disk as a Feather table; a warm start is a
+    near-zero-copy columnar read instead of deserializing pickled dicts.
+    """
+    feather_path = paths.cache / "neighborhoods.feather"
+    if feather_path.exists():
+        return feather.read_table(feather_path).to_pylist()
+
     overpass_url = "http://overpass-api.de/api/interpreter"
 
     # Overpass QL query to get neighborhoods in the city
@@ -59,7 +66,7 @@ def get_all_neighborhoods(city: str = "الرياض") -> list[dict]:
     out center;
     """
 
-    response = get(overpass_url, params={"data": overpass_query}, timeout=180)
+    response = _client.get(overpass_url, params={"data": overpass_query}, timeout=180)
     response.raise_for_status()
     data = response.json()
 
@@ -84,28 +91,33 @@ def get_all_neighborhoods(city: str = "الرياض") -> list[dict]:
                 }
             )
 
+    feather_path.parent.mkdir(parents=True, exist_ok=True)
+    feather.write_feather(pa.Table.from_pylist(neighborhoods), feather_path)
     return neighborhoods
 
 
 # fall back to OSM API for Missing neighborhoods
-@memory.cache
-def osm_fallback(neighborhood: str) -> dict | None:
+# one bulk query with a name regex instead of one request per neighborhood
+@http_cache
+def osm_fallback_bulk(neighborhoods: tuple[str, ...]) -> dict[str, dict]:
     overpass_url = "https://overpass.private.coffee/api/interpreter"
 
+    name_pattern = "^(" + "|".join(re.escape(n) for n in neighborhoods) + ")$"
     overpass_query = f"""
     [out:json][timeout:180];
     (
-      node["place"~"neighbourhood|suburb"]["name"="{neighborhood}"];
-      way["place"~"neighbourhood|suburb"]["name"="{neighborhood}"];
-      relation["place"~"neighbourhood|suburb"]["name"="{neighborhood}"];
+      node["place"~"neighbourhood|suburb"]["name"~"{name_pattern}"];
+      way["place"~"neighbourhood|suburb"]["name"~"{name_pattern}"];
+      relation["place"~"neighbourhood|suburb"]["name"~"{name_pattern}"];
     );
     out center;
     """
 
-    response = get(overpass_url, params={"data": overpass_query}, timeout=180)
+    response = _client.get(overpass_url, params={"data": overpass_query}, timeout=180)
     response.raise_for_status()
     data = response.json()
 
+    found: dict[str, dict] = {}
     for element in data.get("elements", []):
         if "tags" in element and "name" in element["tags"]:
             if element["type"] == "node":
@@ -115,18 +127,22 @@ def osm_fallback(neighborhood: str) -> dict | None:
             else:
                 lat, lon = None, None
 
-            return {
-                "name": element["tags"]["name"],
-                "lat": lat,
-                "lon": lon,
-                "osm_id": element["id"],
-                "osm_type": element["type"],
-            }
-    return None
+            found.setdefault(
+                element["tags"]["name"],
+                {
+                    "name": element["tags"]["name"],
+                    "lat": lat,
+                    "lon": lon,
+                    "osm_id": element["id"],
+                    "osm_type": element["type"],
+                },
+            )
+    return found
 
 
-def fallback_fallback(query: str) -> dict | None:
-    """Use Nominatim API as a last resort to get neighborhood coordinates"""
+async def _nominatim_lookup(
+    client: httpx.AsyncClient, sem: asyncio.Semaphore, query: str
+) -> dict | None:
     nominatim_url = "https://nominatim.openstreetmap.org/search"
     params = {
         "q": query,
@@ -134,7 +150,8 @@ def fallback_fallback(query: str) -> dict | None:
         "addressdetails": 1,
         "limit": 1,
     }
-    response = get(nominatim_url, params=params, timeout=30)
+    async with sem:
+        response = await client.get(nominatim_url, params=params)
     response.raise_for_status()
     data = response.json()
     if data:
@@ -148,13 +165,34 @@ def fallback_fallback(query: str) -> dict | None:
     return None
 
 
+def fallback_fallback(queries: list[str]) -> dict[str, dict]:
+    """Use Nominatim API as a last resort to get neighborhood coordinates.
+
+    Runs the lookups concurrently (bounded by a semaphore) so the wall time
+    is max(RTT) per batch instead of sum(RTT) over all queries.
+    """
+
+    async def _gather() -> list[dict | None]:
+        sem = asyncio.Semaphore(8)
+        limits = httpx.Limits(max_connections=10)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            return await asyncio.gather(
+                *(_nominatim_lookup(client, sem, q) for q in queries)
+            )
+
+    results = asyncio.run(_gather())
+    return {q: r for q, r in zip(queries, results) if r is not None}
+
+
+NORTH_BOUNDARY = 24.77728
+SOUTH_BOUNDARY = 24.59848
+WEST_BOUNDARY = 46.69277
+EAST_BOUNDARY = 46.77850
+
+
 def area_boundry(
     lat: float, lon: float
 ) -> Literal["central", "north", "south", "east", "west"]:
-    NORTH_BOUNDARY = 24.77728
-    SOUTH_BOUNDARY = 24.59848
-    WEST_BOUNDARY = 46.69277
-    EAST_BOUNDARY = 46.77850
     if lat > NORTH_BOUNDARY:
         return "north"
     elif lat < SOUTH_BOUNDARY:
@@ -167,80 +205,115 @@ def area_boundry(
         return "central"
 
 
+def classify_areas(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorized area_boundry over whole lat/lon arrays."""
+    return np.select(
+        [
+            lats > NORTH_BOUNDARY,
+            lats < SOUTH_BOUNDARY,
+            lons < WEST_BOUNDARY,
+            lons > EAST_BOUNDARY,
+        ],
+        ["north", "south", "west", "east"],
+        default="central",
+    )
+
+
 def main() -> None:
     logging.basicConfig(
         level=logging.INFO, format="%(levelname)s %(name)s: %(message)s"
     )
-    data = pd.read_csv(paths.raw / "Aqar_data.csv")
+    # Arrow's CSV reader parses in parallel chunks, unlike pandas' single-threaded parser
+    data = pacsv.read_csv(
+        paths.raw / "Aqar_data.csv",
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=32 << 20),
+        # the details column embeds newlines inside quoted cells
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+    ).to_pandas(types_mapper=pd.ArrowDtype)
     logger.info(f"Read {len(data)} rows from Aqar_data.csv")
-    # Normalize text columns (normalize_text takes a series and returns a series)
-    data = data.assign(
-        location=data["location"].pipe(normalize_text),
-        listTitle=data["listTitle"].pipe(normalize_text),
+    # Normalize text columns, then split location into city and neighborhood
+    # (dropping the leading "حي") in a single regex pass. All derived columns
+    # are computed up front and attached with one assign so the frame is
+    # rebuilt once instead of once per block.
+    location = normalize_text_by_uniques(data["location"])
+    parts = location.str.extract(
+        r"^\s*(?:حي\s*)?(?P<neighborhood>[^-]+?)\s*-\s*(?P<city>.+?)\s*$"
     )
-
-    # split location into city and neighborhood
-    data = data.assign(
-        neighborhood=data["location"].str.split("-", n=1).str[0].str.strip(),
-        city=data["location"].str.split("-", n=1).str[1].str.strip(),
-    )
-    # Remove the word "حي" from neighborhood
     data = data.assign(
-        neighborhood=data["neighborhood"].str.replace("حي", "", regex=False).str.strip()
+        location=location,
+        listTitle=normalize_text_by_uniques(data["listTitle"]),
+        neighborhood=parts["neighborhood"],
+        city=parts["city"],
     )
+    # normalize_text/str.extract fall back to the python-backed string dtype;
+    # keep text columns Arrow-backed so later .str ops and groupby hash in C++
+    for c in ["location", "listTitle"]:
+        data[c] = data[c].astype("string[pyarrow]")
+    # neighborhood/city are low-cardinality keys for map/unique/groupby work:
+    # categorical codes make those integer operations instead of string hashing
+    for c in ["neighborhood", "city"]:
+        data[c] = data[c].astype("category")
     logger.info("Normalized text columns and extracted city and neighborhood")
 
     # Get all neighborhoods and map to area
     neighborhoods = get_all_neighborhoods()
     logger.info(f"Fetched {len(neighborhoods)} neighborhoods from Overpass")
-    neighborhood_to_area = {}
-    for n in neighborhoods:
-        if n["lat"] and n["lon"]:
-            # Clean name to match data['neighborhood']
-            name = n["name"].replace("حي", "").strip()
-            neighborhood_to_area[name] = area_boundry(n["lat"], n["lon"])
-    # log NA neighborhoods
-    na_neighborhoods = set(data["neighborhood"].unique()) - set(
-        neighborhood_to_area.keys()
-    )
+    # Clean names to match data['neighborhood'] and classify all coordinates
+    # in one vectorized pass instead of one area_boundry call per entry
+    located = [n for n in neighborhoods if n["lat"] and n["lon"]]
+    # "حي" is a prefix in OSM names; removeprefix is one bounded compare
+    # instead of a substring search, and it can't corrupt names that merely
+    # contain the token mid-word
+    names = [n["name"].removeprefix("حي").strip() for n in located]
+    lats = np.asarray([n["lat"] for n in located], dtype=float)
+    lons = np.asarray([n["lon"] for n in located], dtype=float)
+    neighborhood_to_area = dict(zip(names, classify_areas(lats, lons)))
+    # log NA neighborhoods (unique() is a full column scan, do it once and
+    # reuse the set for the post-fallback check)
+    all_neighborhoods = set(data["neighborhood"].dropna().unique())
+    na_neighborhoods = all_neighborhoods - neighborhood_to_area.keys()
     if na_neighborhoods:
-        for neighborhood in na_neighborhoods:
-            fallback = osm_fallback(neighborhood)
-            if fallback and fallback["lat"] and fallback["lon"]:
-                neighborhood_to_area[neighborhood] = area_boundry(
-                    fallback["lat"], fallback["lon"]
-                )
-                logger.info(
-                    f"Found fallback area for neighborhood {neighborhood} using a different Overpass Query"
-                )
-            else:
-                logger.warning(
-                    f"No fallback found for neighborhood {neighborhood}! using OSM API Fallback"
-                )
-                nominatim_fallback = fallback_fallback(neighborhood)
-                if (
-                    nominatim_fallback
-                    and nominatim_fallback["lat"]
-                    and nominatim_fallback["lon"]
-                ):
-                    neighborhood_to_area[neighborhood] = area_boundry(
-                        nominatim_fallback["lat"], nominatim_fallback["lon"]
-                    )
-                    logger.info(
-                        f"Found fallback area for neighborhood {neighborhood} using Nominatim API"
-                    )
-                else:
-                    logger.error(
-                        f"No coordinates found for neighborhood {neighborhood} using Nominatim API!"
-                    )
-
-    # recalculate na_neighborhoods
-    na_neighborhoods = set(data["neighborhood"].unique()) - set(
-        neighborhood_to_area.keys()
+        # gather coordinates from all fallback sources up front, then fold
+        # them into the area map with one dict update and one summary log
+        # per source instead of a log line per neighborhood
+        extra: dict[str, tuple[float, float]] = {}
+        # one Overpass round-trip for all missing neighborhoods (sorted tuple
+        # so the cache key is stable)
+        bulk = osm_fallback_bulk(tuple(sorted(na_neighborhoods)))
+        for neighborhood, hit in bulk.items():
+            if hit["lat"] and hit["lon"]:
+                extra[neighborhood] = (hit["lat"], hit["lon"])
+        logger.info(
+            f"Bulk Overpass query resolved {len(extra)}/{len(na_neighborhoods)} missing neighborhoods"
+        )
+        still_missing = [n for n in na_neighborhoods if n not in extra]
+        if still_missing:
+            n_bulk = len(extra)
+            nominatim_fallbacks = fallback_fallback(still_missing)
+            for neighborhood, hit in nominatim_fallbacks.items():
+                if hit["lat"] and hit["lon"]:
+                    extra[neighborhood] = (hit["lat"], hit["lon"])
+            logger.info(
+                f"Nominatim resolved {len(extra) - n_bulk}/{len(still_missing)} remaining neighborhoods"
+            )
+        neighborhood_to_area.update(
+            {n: area_boundry(lat, lon) for n, (lat, lon) in extra.items()}
+        )
+
+    missing_after = all_neighborhoods - neighborhood_to_area.keys()
+    if missing_after:
+        logger.warning(f"Neighborhoods not found in Overpass data: {missing_after}")
+    # categorical area: groupby hashes int8 codes instead of per-row strings
+    data["area"] = (
+        data["neighborhood"]
+        .map(neighborhood_to_area)
+        .fillna("unknown")
+        .astype(
+            pd.CategoricalDtype(
+                categories=["north", "south", "east", "west", "central", "unknown"]
+            )
+        )
     )
-    if na_neighborhoods:
-        logger.warning(f"Neighborhoods not found in Overpass data: {na_neighborhoods}")
-    data["area"] = data["neighborhood"].map(neighborhood_to_area).fillna("unknown")
     logger.info("Added area column")
 
     # find outliers in Price column
@@ -248,17 +321,23 @@ def main() -> None:
     n_outliers = data["price__is_outlier"].sum()
     logger.info(f"Found {n_outliers} outliers in Price column")
 
-    # winsorize Price column for better visualization
-    data = data.assign(price_winsorized=data["price"].pipe(winsorize))
+    # winsorize Price column for better visualization (float32 is plenty
+    # for plotted values and halves the memory traffic)
+    data = data.assign(price_winsorized=data["price"].pipe(winsorize, dtype="float32"))
 
     # Average Price for each area
     logger.info("Computed average winsorized price by area")
 
+    # aggregate in Arrow: hash_mean over the two columns runs in C++ on
+    # chunked arrays instead of the pandas groupby machinery
     avg_price_by_area = (
-        data.groupby("area")["price_winsorized"]
-        .mean()
-        .reset_index()
-        .rename(columns={"price_winsorized": "avg_price_winsorized"})
+        pa.Table.from_pandas(
+            data[["area", "price_winsorized"]], preserve_index=False
+        )
+        .group_by("area")
+        .aggregate([("price_winsorized", "mean")])
+        .to_pandas()
+        .rename(columns={"price_winsorized_mean": "avg_price_winsorized"})
     )
     logger.info("Computed average winsorized price by area")
 
@@ -270,7 +349,13 @@ def main() -> None:
     )
     fig_path: Path = paths.figures / "price_by_location.html"
     fig_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.write_html(fig_path)
+    # load plotly.js from the CDN instead of embedding the ~3 MB bundle per run
+    fig.write_html(
+        fig_path,
+        include_plotlyjs="cdn",
+        full_html=True,
+        config={"responsive": True},
+    )
     logger.info(f"Wrote figure to {fig_path}")
 
 
@@ -27,12 +27,12 @@ def main() -> None:
     paths = config.make_paths(ROOT)
     cfg = ETLConfig(
         root=ROOT,
-        raw_orders=paths.raw / "orders.csv",
-        raw_users=paths.raw / "users.csv",
-        out_orders_clean=paths.processed / "orders_clean.parquet",
-        out_users=paths.processed / "users.parquet",
-        out_analytics=paths.processed / "analytics_table.parquet",
-        run_meta=paths.processed / "_run_meta.json",
+        raw_orders=paths.orders_csv,
+        raw_users=paths.users_csv,
+        out_orders_clean=paths.orders_clean_parquet,
+        out_users=paths.users_parquet,
+        out_analytics=paths.analytics_parquet,
+        run_meta=paths.run_meta,
     )
     run_etl(cfg)
 
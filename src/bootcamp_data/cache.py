@@ -0,0 +1,58 @@
+import functools
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Callable
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS kv_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+    )
+    return conn
+
+
+def sqlite_cached(db_path: Path) -> Callable:
+    """Cache JSON-serializable function results in one SQLite database.
+
+    Unlike joblib.Memory, which pickles every result into its own file and
+    pays a filesystem stat+open per lookup, all entries share one database
+    and a warm lookup is a single indexed SELECT. Values are stored as JSON,
+    so only JSON-serializable returns are supported.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        Decorator caching the wrapped function's result keyed on
+        (function name, hash of the arguments)
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            payload = json.dumps([args, kwargs], sort_keys=True, default=str)
+            key = func.__name__ + ":" + hashlib.sha256(payload.encode()).hexdigest()
+            conn = _connect(db_path)
+            try:
+                row = conn.execute(
+                    "SELECT value FROM kv_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    return json.loads(row[0])
+                result = func(*args, **kwargs)
+                conn.execute(
+                    "INSERT OR REPLACE INTO kv_cache (key, value) VALUES (?, ?)",
+                    (key, json.dumps(result)),
+                )
+                conn.commit()
+                return result
+            finally:
+                conn.close()
+
+        return wrapper
+
+    return decorator
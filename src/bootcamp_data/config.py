@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 
@@ -12,7 +13,38 @@ class Paths:
     reports: Path
     figures: Path
 
+    # the well-known files, built once per Paths instance instead of a fresh
+    # Path composition at every call site
+    @cached_property
+    def orders_csv(self) -> Path:
+        return self.raw / "orders.csv"
 
+    @cached_property
+    def users_csv(self) -> Path:
+        return self.raw / "users.csv"
+
+    @cached_property
+    def orders_parquet(self) -> Path:
+        return self.processed / "orders.parquet"
+
+    @cached_property
+    def users_parquet(self) -> Path:
+        return self.processed / "users.parquet"
+
+    @cached_property
+    def orders_clean_parquet(self) -> Path:
+        return self.processed / "orders_clean.parquet"
+
+    @cached_property
+    def analytics_parquet(self) -> Path:
+        return self.processed / "analytics_table.parquet"
+
+    @cached_property
+    def run_meta(self) -> Path:
+        return self.processed / "_run_meta.json"
+
+
+@lru_cache(maxsize=4)
 def make_paths(root: Path) -> Paths:
     data = root / "data"
     reports = data / "reports"
@@ -1,55 +1,160 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from pathlib import Path
-from httpx import Client
-from typing import Optional
-import json
+from httpx import Client, Limits, Timeout
+from typing import Iterable, Iterator, Optional
+import orjson
 
 import time
 import atexit
 
 _default_client: Optional[Client] = None
 NA_LIST = ["", "NA", "N/A", "null", "None"]
+# passing null_values to Arrow replaces its defaults, so fold the common
+# pandas default tokens back in
+_NULL_VALUES = NA_LIST + ["NaN", "nan", "NULL", "#N/A"]
 
 
 def _get_default_client() -> Client:
     global _default_client
     if _default_client is None:
-        _default_client = Client()
+        # multiplex requests over HTTP/2 and keep connections warm so repeated
+        # fetches against the same host skip the TLS handshake
+        _default_client = Client(
+            http2=True,
+            limits=Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=Timeout(10.0),
+            # only advertise encodings httpx can decode without optional
+            # extras: zstd would need the zstandard package
+            headers={"accept-encoding": "gzip"},
+        )
         atexit.register(_default_client.close)
     return _default_client
 
 
+# Declared dtypes for the order feed; amount and created_at stay inferred
+# because the raw feed contains junk values ('not_a_number', 'not_a_date')
+# that enforce_order_schema coerces to NA downstream — a strict schema here
+# would make the reader raise.
+_ORDER_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    null_values=_NULL_VALUES,
+    strings_can_be_null=True,
+    column_types={
+        "order_id": pa.string(),
+        "user_id": pa.string(),
+        "quantity": pa.int32(),
+        "status": pa.string(),
+    },
+)
+
+
+# Arrow's CSV parser is multi-threaded, unlike the pandas C parser.
 def read_order_csv(filepath: Path) -> pd.DataFrame:
-    df = pd.read_csv(
+    table = pacsv.read_csv(
         filepath,
-        na_values=NA_LIST,
-        dtype={
-            "order_id": "string",
-            "user_id": "string",
-        },
-        keep_default_na=True,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=_ORDER_CONVERT_OPTIONS,
     )
-    return df
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+
+def stream_order_csv(filepath: Path, block_size: int = 8 << 20) -> Iterator[pd.DataFrame]:
+    """Yield the order CSV in batches instead of materializing it whole.
+
+    Args:
+        filepath: Path to the orders CSV
+        block_size: Bytes per parsed batch
+
+    Yields:
+        DataFrame per batch, so peak memory stays at one batch
+    """
+    reader = pacsv.open_csv(
+        filepath,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=block_size),
+        convert_options=_ORDER_CONVERT_OPTIONS,
+    )
+    for batch in reader:
+        yield pa.Table.from_batches([batch]).to_pandas(types_mapper=pd.ArrowDtype)
 
 
 def read_user_csv(filepath: Path) -> pd.DataFrame:
-    df = pd.read_csv(
+    table = pacsv.read_csv(
         filepath,
-        na_values=NA_LIST,
-        dtype={
-            "user_id": str,
-        },
-        keep_default_na=True,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=pacsv.ConvertOptions(
+            null_values=_NULL_VALUES,
+            strings_can_be_null=True,
+            column_types={
+                "user_id": pa.string(),
+                "country": pa.string(),
+                "signup_date": pa.timestamp("ms"),
+            },
+        ),
     )
-    return df
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
 
 
-def write_parquet(df: pd.DataFrame, outpath: Path):
+# zstd-3 writes ~20% smaller files than the snappy default for a negligible
+# write-time cost; pass compression="snappy" when write throughput matters most
+def write_parquet(df: pd.DataFrame, outpath: Path, *, compression: str = "zstd"):
     outpath.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(outpath, index=False)
+    df.to_parquet(
+        outpath,
+        index=False,
+        engine="pyarrow",
+        compression=compression,
+        compression_level=3 if compression == "zstd" else None,
+        use_dictionary=True,
+        # 256k-row groups are small enough for row-group pruning on later
+        # filtered reads while keeping compression ratios close to larger groups
+        row_group_size=256_000,
+        data_page_size=1 << 20,
+        version="2.6",
+    )
     return
 
 
+def write_parquet_stream(
+    chunks: Iterable[pd.DataFrame], outpath: Path, *, compression: str = "zstd"
+) -> int:
+    """Append DataFrame chunks to a single parquet file as row groups.
+
+    The writer is opened on the first chunk's schema, so all chunks must
+    share dtypes (run them through the schema enforcers first).
+
+    Args:
+        chunks: Iterable of DataFrame chunks
+        outpath: Destination parquet path
+        compression: Parquet codec (zstd by default, as in write_parquet)
+
+    Returns:
+        Total number of rows written
+    """
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+    writer = None
+    n_rows = 0
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    outpath,
+                    table.schema,
+                    compression=compression,
+                    compression_level=3 if compression == "zstd" else None,
+                    use_dictionary=True,
+                    version="2.6",
+                )
+            writer.write_table(table)
+            n_rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return n_rows
+
+
 def read_parquet(filepath: Path) -> pd.DataFrame:
     df = pd.read_parquet(filepath)
     return df
@@ -79,10 +184,14 @@ def fetch_from_cache(
     if cache_path.exists():
         age_s = time.time() - cache_path.stat().st_mtime
         if ttl is None or age_s < ttl:
-            data = json.loads(cache_path.read_text())
+            data = orjson.loads(cache_path.read_bytes())
             return data
     data = get_url(url, client)
-    cache_path.write_text(json.dumps(data))
+    # write to a sibling tmp file and rename so a crash mid-write can't
+    # leave a truncated cache entry behind
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(data))
+    tmp_path.replace(cache_path)
 
     return data
 
@@ -1,5 +1,7 @@
 from typing import Literal
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 
 def safe_left_join(
@@ -21,6 +23,8 @@ def safe_left_join(
         | None
     ),
     suffixes: tuple[str, str] = ("", "_r"),
+    right_is_indexed: bool = False,
+    skip_validate_if_presorted: bool = False,
 ):
     """Perform a left join with validation and suffixes.
 
@@ -30,9 +34,54 @@ def safe_left_join(
         on: Column(s) to join on
         validate: Validation string for pd.merge (e.g., '')
         suffixes: Suffixes for overlapping columns
+        right_is_indexed: Right is already indexed by the join key. Callers
+            joining the same lookup table repeatedly should set_index(on)
+            once outside the loop and pass True, which reuses that index
+            instead of hash-building the right side on every call
+        skip_validate_if_presorted: For m:1 joins on a right side that is
+            already sorted by the key, verify uniqueness with an
+            adjacent-equality scan instead of the hash-based check
     Returns:
-        Merged DataFrame
+        Merged DataFrame (row order may differ from left on the Arrow path)
     """
+    if right_is_indexed:
+        return left.merge(
+            right,
+            how="left",
+            left_on=on,
+            right_index=True,
+            validate=validate,
+            suffixes=suffixes,
+        )
+    # m:1 on a single key with a unique right side is the common hot case;
+    # route it through Arrow's multi-threaded hash join, which also makes the
+    # uniqueness check explicit instead of paying pandas' validate scan
+    if isinstance(on, str) and validate in ("many_to_one", "m:1"):
+        if skip_validate_if_presorted and right[on].is_monotonic_increasing:
+            # sorted key: duplicates are adjacent, no hash set needed
+            a = right[on].to_numpy()
+            assert not np.any(a[1:] == a[:-1]), f"right key {on} is not unique"
+            right_unique = True
+        else:
+            right_unique = right[on].is_unique
+    else:
+        right_unique = False
+    if right_unique:
+        return (
+            pa.Table.from_pandas(left, preserve_index=False)
+            .join(
+                pa.Table.from_pandas(right, preserve_index=False),
+                keys=on,
+                join_type="left outer",
+                right_suffix=suffixes[1],
+            )
+            # dictionary columns (pandas categoricals) must fall back to the
+            # default Categorical conversion: ArrowDtype(dictionary) cannot be
+            # reconstructed from parquet pandas metadata on read
+            .to_pandas(
+                types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t)
+            )
+        )
     return pd.merge(
         left,
         right,
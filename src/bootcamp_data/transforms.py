@@ -1,30 +1,92 @@
 from typing import Literal
+import numpy as np
 import pandas as pd
-import re
+import pyarrow as pa
+import pyarrow.compute as pc
 
-_ws = re.compile(r"\s+")
+
+def _cast_if_needed(col: pd.Series, target: str) -> pd.Series:
+    """Cast only when the dtype differs, so re-enforcing a frame is a no-op."""
+    return col if col.dtype == target else col.astype(target)
+
+
+def _coerce_numeric(col: pd.Series, target: str) -> pd.Series:
+    """Numeric coercion that skips already-conforming columns entirely."""
+    if col.dtype == target:
+        return col
+    coerced = pd.to_numeric(col, errors="coerce")
+    # route the numpy result through from_pandas so coerced junk becomes a
+    # proper Arrow null instead of a NaN payload — a NaN value slips past
+    # isna() and the Arrow null_count metadata the missingness report reads
+    arr = pa.array(coerced.to_numpy(dtype="float64", na_value=np.nan), from_pandas=True)
+    return pd.Series(arr, dtype="float64[pyarrow]", index=col.index).astype(target)
+
+
+def _categorize_if_low_cardinality(s: pd.Series, max_categories: int = 1024) -> pd.Series:
+    """Cast to category when the value set is small, else Arrow string.
+
+    Low-cardinality fields as category store one small integer code per row,
+    so groupbys and comparisons work on codes; high-cardinality data would
+    just pay for a huge dictionary, so it stays as Arrow-backed strings.
+    """
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return s
+    if s.nunique(dropna=True) <= max_categories:
+        return s.astype("category")
+    return s.astype("string[pyarrow]")
 
 
 def enforce_order_schema(df: pd.DataFrame) -> pd.DataFrame:
-    return df.assign(
-        order_id=df["order_id"].astype(str),
-        user_id=df["user_id"].astype(str),
-        amount=pd.to_numeric(df["amount"], errors="coerce").astype("Float64"),
-        quantity=pd.to_numeric(df["quantity"], errors="coerce").astype("Int64"),
-        status=df["status"].astype("string"),
+    # Arrow-backed dtypes: string columns live in contiguous Arrow buffers
+    # instead of per-row PyObjects, and numeric NA handling stays in C++
+    # the plain string casts go through one batched astype(dict) call (a
+    # single manager rewrite); coercion/categorization need their own logic
+    casts = {
+        c: "string[pyarrow]"
+        for c in ("order_id", "user_id")
+        if df[c].dtype != "string[pyarrow]"
+    }
+    out = df.astype(casts) if casts else df
+    return out.assign(
+        amount=_coerce_numeric(out["amount"], "float64[pyarrow]"),
+        quantity=_coerce_numeric(out["quantity"], "int64[pyarrow]"),
+        status=_categorize_if_low_cardinality(out["status"]),
     )
 
 
-def parse_datetime(df: pd.DataFrame, col: str, utc: bool = True) -> pd.DataFrame:
+def parse_datetime(
+    df: pd.DataFrame, col: str, utc: bool = True, fmt: str | None = "ISO8601"
+) -> pd.DataFrame:
     """Parse a column as datetime, coercing errors to NaT.
     Args:
         df: Input DataFrame
         col: Column name to parse
         utc: Whether to set timezone to UTC
+        fmt: Format passed to to_datetime; the ISO8601 default skips
+            per-row format inference (pass None to re-enable inference)
     Returns:
         DataFrame with parsed datetime column
     """
-    return df.assign(**{col: pd.to_datetime(df[col], errors="coerce", utc=utc)})
+    # already-parsed columns pass through untouched; re-parsing would scan
+    # the column again for nothing (unless a tz conversion is still needed).
+    # Arrow-backed timestamps still go through to_datetime so downstream
+    # .dt accessors see a numpy-backed datetime column.
+    dtype = df[col].dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype) and not isinstance(
+        dtype, pd.ArrowDtype
+    ):
+        if not utc or df[col].dt.tz is not None:
+            return df
+    return df.assign(
+        **{col: pd.to_datetime(df[col], errors="coerce", utc=utc, format=fmt)}
+    )
+
+
+# 1970-01-01 (epoch day 0) was a Thursday, index 3 with Monday first
+_DOW_NAMES = np.array(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+    dtype=object,
+)
 
 
 def add_time_parts(df: pd.DataFrame, ts_col: str) -> pd.DataFrame:
@@ -39,15 +101,64 @@ def add_time_parts(df: pd.DataFrame, ts_col: str) -> pd.DataFrame:
         raise ValueError(f"Timestamp column '{ts_col}' not found in DataFrame.")
     ts = df[ts_col]
 
+    # derive date/year/dow/hour with integer arithmetic on the ns-since-epoch
+    # array instead of one .dt accessor pass (and allocation) per part
+    ns = ts.to_numpy(dtype="datetime64[ns]")
+    days = ns.astype("datetime64[D]")
+    day_i8 = days.view("i8")
+    date_vals = days.astype(object)
+    year_vals = days.astype("datetime64[Y]").view("i8") + 1970
+    dow_vals = _DOW_NAMES[(day_i8 + 3) % 7]
+    hour_vals = (ns.view("i8") // 3_600_000_000_000) % 24
+    # one vectorized C format pass to "YYYY-MM"; the old to_period route
+    # allocated a PeriodArray and stringified one Period object per row
+    month_vals = pd.array(
+        np.datetime_as_string(days.astype("datetime64[M]"), unit="M"),
+        dtype="string[pyarrow]",
+    )
+
+    nat = np.isnat(ns)
+    if nat.any():
+        # match the .dt accessors: NaT rows yield NaT/NA (ints become float)
+        date_vals[nat] = pd.NaT
+        dow_vals = dow_vals.copy()
+        dow_vals[nat] = np.nan
+        year_vals = np.where(nat, np.nan, year_vals)
+        hour_vals = np.where(nat, np.nan, hour_vals)
+        month_vals[nat] = pd.NA
+
     return df.assign(
-        date=ts.dt.date,
-        year=ts.dt.year,
-        month=ts.dt.to_period("M").astype("string"),
-        dow=ts.dt.day_name(),
-        hour=ts.dt.hour,
+        date=date_vals,
+        year=year_vals,
+        month=month_vals,
+        dow=dow_vals,
+        hour=hour_vals,
     )
 
 
+def _iqr_bounds_arr(arr: np.ndarray, k: float) -> tuple[float, float]:
+    """IQR bounds from a float array (NaN for missing), one partition pass.
+
+    np.partition places the four order statistics needed for the two
+    quantiles in O(n) instead of the O(n log n) sort behind quantile();
+    the linear interpolation between neighbours matches nanquantile's
+    default method exactly.
+    """
+    vals = arr[~np.isnan(arr)]
+    n = vals.size
+    if n == 0:
+        return float("nan"), float("nan")
+    pos1 = 0.25 * (n - 1)
+    pos3 = 0.75 * (n - 1)
+    lo1, hi1 = int(np.floor(pos1)), int(np.ceil(pos1))
+    lo3, hi3 = int(np.floor(pos3)), int(np.ceil(pos3))
+    part = np.partition(vals, sorted({lo1, hi1, lo3, hi3}))
+    q1 = part[lo1] + (pos1 - lo1) * (part[hi1] - part[lo1])
+    q3 = part[lo3] + (pos3 - lo3) * (part[hi3] - part[lo3])
+    iqr = q3 - q1
+    return float(q1 - k * iqr), float(q3 + k * iqr)
+
+
 def iqr_bounds(s: pd.Series, k: float = 1.5) -> tuple[float, float]:
     """Return (lo, hi) IQR bounds for outlier flagging.
     Args:
@@ -56,15 +167,7 @@ def iqr_bounds(s: pd.Series, k: float = 1.5) -> tuple[float, float]:
     Returns:
         Tuple of (lo, hi) bounds
     """
-    x = s.dropna()
-    q1 = x.quantile(
-        0.25,
-    )
-    q3 = x.quantile(
-        0.75,
-    )
-    iqr = q3 - q1
-    return float(q1 - k * iqr), float(q3 + k * iqr)
+    return _iqr_bounds_arr(s.to_numpy(dtype="float64", na_value=np.nan), k)
 
 
 def count_outliers(s: pd.Series, k: float = 1.5) -> int:
@@ -75,8 +178,9 @@ def count_outliers(s: pd.Series, k: float = 1.5) -> int:
     Returns:
         Number of outlier values
     """
-    lo, hi = iqr_bounds(s, k)
-    return int(((s < lo) | (s > hi)).sum())
+    arr = s.to_numpy(dtype="float64", na_value=np.nan)
+    lo, hi = _iqr_bounds_arr(arr, k)
+    return int(np.count_nonzero((arr < lo) | (arr > hi)))
 
 
 def add_outlier_flag(df: pd.DataFrame, col: str, *, k: float = 1.5) -> pd.DataFrame:
@@ -88,22 +192,61 @@ def add_outlier_flag(df: pd.DataFrame, col: str, *, k: float = 1.5) -> pd.DataFr
     Returns:
         DataFrame with new outlier flag column
     """
-    lo, hi = iqr_bounds(df[col], k=k)
-    return df.assign(**{f"{col}__is_outlier": (df[col] < lo) | (df[col] > hi)})
+    # extract the column once; both the quantile pass and the mask run on
+    # the same numpy array (NaN comparisons are False, so missing rows are
+    # flagged False rather than NA)
+    arr = df[col].to_numpy(dtype="float64", na_value=np.nan)
+    lo, hi = _iqr_bounds_arr(arr, k)
+    return df.assign(**{f"{col}__is_outlier": (arr < lo) | (arr > hi)})
+
+
+def _winsor_and_flag(
+    a: np.ndarray, *, lo: float = 0.01, hi: float = 0.99, k: float = 1.5
+) -> tuple[np.ndarray, np.ndarray]:
+    """Winsorized values and IQR outlier flags from one quantile pass.
+
+    Shared kernel for callers that need both columns: a single nanquantile
+    call yields the winsor caps (p_lo/p_hi) and the IQR fence (q1/q3, k),
+    so the input array is scanned once per output instead of re-sorted per
+    helper.
+
+    Args:
+        a: Float array (NaN for missing)
+        lo: Lower winsor quantile (default 0.01)
+        hi: Upper winsor quantile (default 0.99)
+        k: IQR multiplier for the outlier fence (default 1.5)
+
+    Returns:
+        Tuple of (winsorized values, boolean outlier flags)
+    """
+    p_lo, q1, q3, p_hi = np.nanquantile(a, [lo, 0.25, 0.75, hi])
+    fence = k * (q3 - q1)
+    flag = (a < q1 - fence) | (a > q3 + fence)
+    return np.clip(a, p_lo, p_hi), flag
 
 
-def winsorize(s: pd.Series, lo: float = 0.01, hi: float = 0.99) -> pd.Series:
+def winsorize(
+    s: pd.Series, lo: float = 0.01, hi: float = 0.99, *, dtype: str = "float64"
+) -> pd.Series:
     """Cap values to [p_lo, p_hi] (helpful for visualization, not deletion).
     Args:
         s: Series of numeric values
         lo: Lower quantile (default 0.01)
         hi: Upper quantile (default 0.99)
+        dtype: Working dtype; visualization-only callers can pass "float32"
+            to halve memory bandwidth — plenty of precision for capped
+            plot values, but an opt-in so persisted columns stay float64
     Returns:
-        Series with capped values
+        Series with capped values (in the working dtype)
     """
-    x = s.dropna()
-    a, b = x.quantile(lo), x.quantile(hi)
-    return s.clip(lower=a, upper=b)
+    arr = s.to_numpy(dtype=dtype, na_value=np.nan)
+    if len(arr) and not np.all(np.isnan(arr)):
+        a, b = np.nanquantile(arr, [lo, hi])
+        # no out=: to_numpy may return a view of the Series' own buffer for
+        # numpy-backed float input, and clipping that in place would mutate
+        # the caller's column (or raise on read-only blocks in pandas 3.x)
+        arr = np.clip(arr, a, b)
+    return pd.Series(arr, index=s.index, name=s.name)
 
 
 def enforce_user_schema(df: pd.DataFrame) -> pd.DataFrame:
@@ -114,8 +257,8 @@ def enforce_user_schema(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with enforced schema
     """
     return df.assign(
-        user_id=df["user_id"].astype(str),
-        country=df["country"].astype("string"),
+        user_id=_cast_if_needed(df["user_id"], "string[pyarrow]"),
+        country=_categorize_if_low_cardinality(df["country"]),
     )
 
 
@@ -128,13 +271,26 @@ def missingness_report(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with n_missing and p_missing columns, sorted by p_missing desc
     """
     n = len(df)
-    return (
-        df.isna()
-        .sum()
-        .rename("n_missing")
-        .to_frame()
-        .assign(p_missing=lambda t: t["n_missing"] / n)
-        .sort_values("p_missing", ascending=False)
+    if n > 0 and all(isinstance(dt, pd.ArrowDtype) for dt in df.dtypes):
+        # Arrow arrays carry null_count as metadata, so for Arrow-backed
+        # frames the counts are O(columns) with no row scan; from_pandas is
+        # zero-copy here
+        t = pa.Table.from_pandas(df, preserve_index=False)
+        nm = np.array([c.null_count for c in t.columns], dtype="int64")
+    else:
+        # per-column count over the raw values: no N x M boolean frame, just
+        # one vectorized isna + count per column
+        nm = np.array(
+            [np.count_nonzero(pd.isna(df[c].to_numpy())) for c in df.columns],
+            dtype="int64",
+        )
+    # assemble the sorted report directly: one argsort over the ratios
+    # instead of the to_frame/assign/sort_values chain, each of which copies
+    pm = nm / n if n else np.full(len(nm), np.nan)
+    order = np.argsort(-pm, kind="stable")
+    return pd.DataFrame(
+        {"n_missing": nm[order], "p_missing": pm[order]},
+        index=df.columns[order],
     )
 
 
@@ -148,11 +304,10 @@ def add_missing_flags(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
     Returns:
         DataFrame with new columns like 'amount__isna' (True/False)
     """
-    out = df.copy()
-    for c in cols:
-        out[f"{c}__isna"] = out[c].isna()
-
-    return out
+    # assign builds one new frame referencing the existing blocks plus the
+    # flag arrays — no copy of the input data and no per-column insertion
+    flags = {f"{c}__isna": df[c].isna().to_numpy() for c in cols}
+    return df.assign(**flags)
 
 
 def normalize_text(s: pd.Series) -> pd.Series:
@@ -164,9 +319,32 @@ def normalize_text(s: pd.Series) -> pd.Series:
     Returns:
         Normalized series
     """
-    return (
-        s.astype("string").str.strip().str.casefold().str.replace(_ws, " ", regex=True)
+    # run the whole chain in Arrow's C++ string kernels over one contiguous
+    # buffer; the pandas .str chain re-allocated a new array per step and the
+    # compiled-regex replace fell back to per-element Python dispatch
+    arr = s.astype("string[pyarrow]").array._pa_array
+    out = pc.replace_substring_regex(
+        pc.utf8_lower(pc.utf8_trim_whitespace(arr)), pattern=r"\s+", replacement=" "
     )
+    return pd.Series(out, dtype="string[pyarrow]", index=s.index, name=s.name)
+
+
+def normalize_text_by_uniques(s: pd.Series) -> pd.Series:
+    """Normalize text by running normalize_text once per unique value.
+
+    For columns with far fewer unique values than rows, the normalization
+    work drops from one pass per row to one per unique value, with a map
+    back onto the original index.
+
+    Args:
+        s: Series of text values
+
+    Returns:
+        Normalized series
+    """
+    uniq = pd.Series(s.dropna().unique())
+    mapping = dict(zip(uniq, normalize_text(uniq)))
+    return s.map(mapping)
 
 
 def apply_mapping(s: pd.Series, mapping: dict) -> pd.Series:
@@ -179,7 +357,13 @@ def apply_mapping(s: pd.Series, mapping: dict) -> pd.Series:
     Returns:
         Series with mapped values
     """
-    return s.map(lambda x: mapping.get(x, x))
+    if not mapping:
+        return s
+    # dict-based map is a C-level hash lookup over the whole array; the
+    # where() restores values the mapping doesn't cover (lambda-per-row
+    # dispatch was the hot frame here)
+    mapped = s.map(mapping)
+    return mapped.where(mapped.notna(), s)
 
 
 def dedupe_keep_latest(
@@ -193,10 +377,31 @@ def dedupe_keep_latest(
         ts_col: Timestamp column to sort by
 
     Returns:
-        Deduplicated DataFrame
+        Deduplicated DataFrame. Both paths keep the same rows, but the fast
+        path returns them in key-appearance order while the sort fallback
+        returns them ordered by timestamp
     """
+    # heavy duplication: one hash-group idxmax pass picks the latest row per
+    # key without sorting (and re-allocating) the whole frame
+    if df[key_cols].nunique().prod() < len(df) / 4:
+        df = df.reset_index(drop=True)
+        # work on the epoch-int view with NaT mapped to int64 max: that
+        # mirrors sort_values' na_position="last" (NaT outranks real
+        # timestamps) and keeps all-NaT groups from raising in idxmax.
+        # Scanning in reverse makes ties keep the last occurrence, matching
+        # the fallback's keep="last"
+        ts = df[ts_col].to_numpy("datetime64[ns]")
+        ts_i8 = np.where(np.isnat(ts), np.iinfo("i8").max, ts.view("i8"))
+        rev = pd.Series(ts_i8[::-1], index=df.index[::-1])
+        keys = [df[c].iloc[::-1] for c in key_cols]
+        # dropna=False: drop_duplicates treats NA keys as a group of their
+        # own and keeps a row for them, so the fast path must too
+        idx = rev.groupby(keys, sort=False, observed=True, dropna=False).idxmax()
+        return df.loc[idx].reset_index(drop=True)
+    # stable sort so keep="last" ties on equal timestamps stay deterministic
+    # (input order decides) regardless of the underlying sort algorithm
     return (
-        df.sort_values(ts_col)
+        df.sort_values(ts_col, kind="stable")
         .drop_duplicates(subset=key_cols, keep="last")
         .reset_index(drop=True)
     )